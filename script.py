@@ -1,14 +1,23 @@
 import os
 import sys
-import time
 import json
+import time
+import random
+import asyncio
 import logging
-from typing import Dict, Any, List, Optional
-
-import requests
-from web3 import Web3
-from web3.contract import Contract
+import functools
+import collections
+from typing import Dict, Any, List, Optional, Tuple
+
+import orjson
+import msgspec
+import aiohttp
+from web3 import AsyncWeb3, Web3
+from web3.contract import AsyncContract
 from web3.exceptions import BlockNotFound
+from web3._utils.events import get_event_data
+from eth_utils import event_abi_to_log_topic
+from hexbytes import HexBytes
 from dotenv import load_dotenv
 
 # --- Configuration ---
@@ -20,11 +29,22 @@ logging.basicConfig(
     format='%(asctime)s - %(levelname)s - [%(module)s.%(funcName)s] - %(message)s',
     stream=sys.stdout
 )
+logger = logging.getLogger(__name__)
 
 # --- System Configuration ---
 # Source chain (e.g., Ethereum Mainnet, Goerli Testnet)
 SOURCE_CHAIN_RPC_URL = os.getenv('SOURCE_CHAIN_RPC_URL', 'https://rpc.ankr.com/eth_goerli')
 
+# How long (in seconds) a fetched head block number stays fresh before
+# eth_blockNumber is issued again. A fraction of the chain's block time is a
+# safe default; repeated callers within the window get the cached value.
+LATEST_BLOCK_TTL = float(os.getenv('LATEST_BLOCK_TTL', '2'))
+
+# Optional WebSocket endpoint for the source chain. When set, the orchestrator
+# switches from interval polling to a persistent eth_subscribe push stream,
+# which lowers detection latency to roughly one block. Leave empty to poll.
+SOURCE_CHAIN_WS_URL = os.getenv('SOURCE_CHAIN_WS_URL', '')
+
 # A mock destination API endpoint for simulating the relaying action
 DESTINATION_API_ENDPOINT = os.getenv('DESTINATION_API_ENDPOINT', 'https://jsonplaceholder.typicode.com/posts')
 
@@ -90,14 +110,78 @@ EVENT_NAME = 'TokensLocked'
 # How often the orchestrator should check for new blocks (in seconds)
 SCAN_INTERVAL_SECONDS = 15
 
-# The maximum number of blocks to scan in a single request to the RPC node
-# A smaller number is safer and less likely to cause timeouts on public RPCs
+# The initial number of blocks to scan in a single request to the RPC node.
+# The scanner adapts this at runtime: it halves the range when the node
+# times out or rejects the query as too large, and doubles it again after
+# a streak of successful requests, within the bounds below.
 MAX_BLOCK_RANGE = 500
+MIN_BLOCK_RANGE = 32
+MAX_BLOCK_RANGE_CAP = 10_000
+
+# How many consecutive successful requests before the scan range is doubled
+RANGE_GROWTH_SUCCESSES = 3
+
+# Quiescence policy: an exponential moving average of events per scanned block
+# decides how aggressively the range grows. Most bridge scan windows are
+# empty, and an empty eth_getLogs over a wide range is cheap for the node, so
+# an idle contract (EMA below the threshold) jumps toward the cap in larger
+# steps; once events reappear, the range falls back to the initial value.
+EVENT_DENSITY_EMA_ALPHA = 0.2
+EVENT_DENSITY_IDLE_THRESHOLD = 1e-4
+
+# How many block-range chunks may be fetched concurrently during catch-up.
+# Non-overlapping eth_getLogs calls are independent, so catch-up after
+# downtime compresses roughly by this factor.
+MAX_CONCURRENT_FETCHES = int(os.getenv('MAX_CONCURRENT_FETCHES', '5'))
+
+# How many relay POSTs may be in flight at once. Keeps event-heavy chunks from
+# serializing N round trips while staying below the destination's rate limit.
+RELAY_CONCURRENCY = int(os.getenv('RELAY_CONCURRENCY', '8'))
+
+# How many recently relayed transaction hashes to remember. Reorgs and resumed
+# runs can re-deliver events; duplicates within this window are not re-POSTed.
+SEEN_TX_CACHE_SIZE = 100_000
+
+# Relay retry policy: transient destination failures are retried with
+# exponential backoff plus jitter instead of dropping the event.
+RELAY_MAX_ATTEMPTS = 5
+RETRYABLE_STATUS_CODES = {429, 502, 503, 504}
 
 # The number of blocks to wait for finality before processing an event.
 # This helps prevent processing events from blocks that might be reorganized.
 CONFIRMATION_BLOCKS = 12
 
+# Where the scan cursor is persisted, so a restart resumes where it left off
+# instead of re-scanning from the chain head.
+STATE_FILE = os.getenv('STATE_FILE', 'bridge_state.json')
+
+class OrjsonAsyncHTTPProvider(AsyncWeb3.AsyncHTTPProvider):
+    """
+    AsyncHTTPProvider with orjson request/response codecs.
+
+    eth_getLogs responses can run to megabytes; orjson decodes them several
+    times faster than the stdlib json web3's default provider uses.
+    """
+
+    def encode_rpc_request(self, method, params) -> bytes:
+        return orjson.dumps({
+            'jsonrpc': '2.0',
+            'method': method,
+            'params': params or [],
+            'id': next(self.request_counter),
+        })
+
+    def decode_rpc_response(self, raw_response: bytes):
+        return orjson.loads(raw_response)
+
+@functools.lru_cache(maxsize=1024)
+def _checksum_address(address: str) -> str:
+    """
+    EIP-55 checksum encoding, memoized. The keccak256 hash of the hex string
+    dominates the cost, so repeat lookups of the same address become dict hits.
+    """
+    return Web3.to_checksum_address(address)
+
 class BlockchainConnector:
     """A wrapper class for Web3.py to manage the connection to a blockchain node."""
 
@@ -105,46 +189,123 @@ class BlockchainConnector:
         """
         Initializes the connector with an RPC URL.
 
+        Connecting is deferred to the async connect() so the constructor can
+        run outside an event loop.
+
         Args:
-            rpc_url (str): The HTTP or WebSocket URL of the blockchain node.
+            rpc_url (str): The HTTP URL of the blockchain node.
         """
         self.rpc_url = rpc_url
-        self.web3: Optional[Web3] = None
-        self.connect()
+        self.web3: Optional[AsyncWeb3] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._contract_cache: Dict[Tuple[str, int], AsyncContract] = {}
+        self._latest_cache: Tuple[int, float] = (0, 0.0)
+        self._healthy = False
+
+    async def connect(self) -> None:
+        """
+        Establishes a connection to the blockchain node.
 
-    def connect(self) -> None:
-        """Establishes a connection to the blockchain node."""
+        One pooled, keep-alive session backs both the web3 provider and
+        batch_call, so every request reuses a warm TLS connection instead of
+        paying a TCP+TLS handshake whenever a default-sized pool recycles.
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=60, ttl_dns_cache=300)
+            )
         try:
-            self.web3 = Web3(Web3.HTTPProvider(self.rpc_url))
-            if not self.is_connected():
+            provider = OrjsonAsyncHTTPProvider(self.rpc_url)
+            await provider.cache_async_session(self._session)
+            self.web3 = AsyncWeb3(provider)
+            if not await self.is_connected():
                 raise ConnectionError("Failed to connect to the blockchain node.")
-            logging.info(f"Successfully connected to blockchain node at {self.rpc_url}")
+            self._healthy = True
+            logger.info("Successfully connected to blockchain node at %s", self.rpc_url)
         except Exception as e:
-            logging.error(f"Error connecting to blockchain node: {e}")
+            logger.error("Error connecting to blockchain node: %s", e)
             self.web3 = None
+            self._healthy = False
 
-    def is_connected(self) -> bool:
-        """Checks if the connection to the node is active."""
-        return self.web3 is not None and self.web3.is_connected()
+    async def is_connected(self) -> bool:
+        """
+        Checks if the connection to the node is active.
+
+        This issues a web3_clientVersion probe, so it is reserved for explicit
+        checks (boot, failure recovery); the hot path trusts the cached
+        _healthy flag, treating successful RPCs themselves as the liveness
+        signal.
+        """
+        return self.web3 is not None and await self.web3.is_connected()
 
-    def get_latest_block(self) -> Optional[int]:
+    async def get_latest_block(self) -> Optional[int]:
         """
-        Fetches the latest block number from the blockchain.
+        Fetches the latest block number, cached for LATEST_BLOCK_TTL seconds.
+
+        The TTL suppresses redundant eth_blockNumber round trips when several
+        callers ask within the same block interval.
 
         Returns:
             Optional[int]: The latest block number, or None if an error occurs.
         """
-        if not self.is_connected():
-            logging.warning("Not connected. Attempting to reconnect...")
-            self.connect()
-        if self.is_connected():
-            try:
-                return self.web3.eth.block_number
-            except Exception as e:
-                logging.error(f"Could not fetch latest block number: {e}")
+        value, expiry = self._latest_cache
+        if time.monotonic() < expiry:
+            return value
+        if not self._healthy:
+            logger.warning("Not connected. Attempting to reconnect...")
+            await self.connect()
+            if not self._healthy:
+                return None
+        try:
+            number = await self.web3.eth.block_number
+            self._latest_cache = (number, time.monotonic() + LATEST_BLOCK_TTL)
+            return number
+        except Exception as e:
+            # The failed call is itself the liveness signal; the next call
+            # will run the full reconnect probe.
+            self._healthy = False
+            logger.error("Could not fetch latest block number: %s", e)
         return None
 
-    def get_contract(self, address: str, abi: List[Dict]) -> Optional[Contract]:
+    async def batch_call(self, calls: List[Tuple[str, list]]) -> List[Any]:
+        """
+        Issues several JSON-RPC calls in a single HTTP request.
+
+        Batching guarantees all calls are answered by the same backend node
+        (important behind load-balanced providers) and collapses their HTTP
+        round trips into one.
+
+        Args:
+            calls (List[Tuple[str, list]]): The (method, params) pairs to execute.
+
+        Returns:
+            List[Any]: The results, in the same order as the calls.
+
+        Raises:
+            ValueError: If the node returns an error for any call in the batch.
+        """
+        batch = [
+            {'jsonrpc': '2.0', 'id': i, 'method': method, 'params': params}
+            for i, (method, params) in enumerate(calls)
+        ]
+        async with self._session.post(
+            self.rpc_url,
+            data=orjson.dumps(batch),
+            headers={'Content-Type': 'application/json'},
+            timeout=aiohttp.ClientTimeout(total=30),
+        ) as response:
+            response.raise_for_status()
+            body = orjson.loads(await response.read())
+        by_id = {item['id']: item for item in body}
+        results = []
+        for i in range(len(calls)):
+            item = by_id[i]
+            if 'error' in item:
+                raise ValueError(item['error'])
+            results.append(item['result'])
+        return results
+
+    async def get_contract(self, address: str, abi: List[Dict]) -> Optional[AsyncContract]:
         """
         Creates a Web3.py Contract object.
 
@@ -153,31 +314,120 @@ class BlockchainConnector:
             abi (List[Dict]): The ABI of the smart contract.
 
         Returns:
-            Optional[Contract]: A contract object, or None if not connected.
+            Optional[AsyncContract]: A contract object, or None if not connected.
         """
-        if self.is_connected():
-            checksum_address = Web3.to_checksum_address(address)
-            return self.web3.eth.contract(address=checksum_address, abi=abi)
-        logging.error("Cannot create contract object, not connected to the blockchain.")
+        cache_key = (address.lower(), id(abi))
+        cached = self._contract_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        if await self.is_connected():
+            checksum_address = _checksum_address(address)
+            contract = self.web3.eth.contract(address=checksum_address, abi=abi)
+            self._contract_cache[cache_key] = contract
+            return contract
+        logger.error("Cannot create contract object, not connected to the blockchain.")
         return None
 
+    async def close(self) -> None:
+        """Releases the underlying HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+def _is_retryable_range_error(exc: Exception) -> bool:
+    """
+    Determines whether an RPC error indicates the requested block range was
+    too large for the node, i.e. retrying with a smaller span may succeed.
+    """
+    if isinstance(exc, asyncio.TimeoutError):
+        return True
+    if isinstance(exc, ValueError):
+        message = str(exc)
+        return (
+            '-32005' in message
+            or 'query returned more than' in message
+            or 'timeout' in message.lower()
+        )
+    return False
+
 class EventScanner:
     """Scans a range of blocks on the blockchain for specific smart contract events."""
 
-    def __init__(self, contract: Contract):
+    def __init__(self, contract: AsyncContract):
         """
         Initializes the scanner with a contract object.
 
         Args:
-            contract (Contract): The Web3.py contract object to scan events from.
+            contract (AsyncContract): The Web3.py contract object to scan events from.
         """
-        if not isinstance(contract, Contract):
-            raise TypeError("contract must be a valid Web3.py Contract instance.")
+        if not isinstance(contract, AsyncContract):
+            raise TypeError("contract must be a valid Web3.py AsyncContract instance.")
         self.contract = contract
         self.event_name = EVENT_NAME
-        logging.info(f"EventScanner initialized for contract {self.contract.address} and event '{self.event_name}'.")
 
-    def scan_blocks(self, from_block: int, to_block: int) -> List[Dict[str, Any]]:
+        # Precompute everything the hot path needs — the ABI entry, its log
+        # topic, the codec, and the address — so scanning is a dict literal
+        # plus one RPC call, with no per-scan ABI traversal.
+        try:
+            self.event_abi = next(
+                entry for entry in contract.abi
+                if entry.get('type') == 'event' and entry.get('name') == self.event_name
+            )
+        except StopIteration:
+            raise ValueError(f"Event '{self.event_name}' not found in the contract ABI.")
+        self.event_topic = '0x' + event_abi_to_log_topic(self.event_abi).hex()
+        self._codec = contract.w3.codec
+        self._address = contract.address
+
+        # Adaptive request sizing: shrinks on node timeouts, grows back on success.
+        self.current_range = MAX_BLOCK_RANGE
+        self._consecutive_successes = 0
+        self._events_per_block_ema = 0.0
+        logger.info("EventScanner initialized for contract %s and event '%s'.", self.contract.address, self.event_name)
+
+    def build_filter_params(self, from_block: int, to_block: int) -> Dict[str, Any]:
+        """
+        Builds raw eth_getLogs filter params for a block span.
+
+        Block numbers are hex-encoded so the dict is usable both with web3's
+        get_logs and as-is inside a raw JSON-RPC batch.
+        """
+        return {
+            'address': self._address,
+            'topics': [self.event_topic],
+            'fromBlock': hex(from_block),
+            'toBlock': hex(to_block),
+        }
+
+    def decode_logs(self, raw_logs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Decodes raw logs (from web3 or a raw JSON-RPC batch) into events.
+
+        The decoded AttributeDicts are returned as-is rather than copied into
+        plain dicts: consumers only read from them, and the copy would double
+        transient memory during catch-up bursts for no benefit.
+        """
+        return [
+            get_event_data(self._codec, self.event_abi, self._normalize_log(log))
+            for log in raw_logs
+        ]
+
+    @staticmethod
+    def _normalize_log(raw_log: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Converts a raw JSON-RPC log entry (all hex strings) into the formatted
+        shape get_event_data expects. Logs already formatted by web3 pass through.
+        """
+        if not isinstance(raw_log.get('blockNumber'), str):
+            return raw_log
+        log = dict(raw_log)
+        log['topics'] = [HexBytes(topic) for topic in log['topics']]
+        for key in ('data', 'transactionHash', 'blockHash'):
+            log[key] = HexBytes(log[key])
+        for key in ('blockNumber', 'logIndex', 'transactionIndex'):
+            log[key] = int(log[key], 16)
+        return log
+
+    async def scan_blocks(self, from_block: int, to_block: int) -> List[Dict[str, Any]]:
         """
         Scans a given range of blocks for the configured event.
 
@@ -189,24 +439,77 @@ class EventScanner:
             List[Dict[str, Any]]: A list of decoded event logs.
         """
         if from_block > to_block:
-            logging.warning(f"from_block ({from_block}) cannot be greater than to_block ({to_block}). No scan performed.")
+            logger.warning("from_block (%s) cannot be greater than to_block (%s). No scan performed.", from_block, to_block)
             return []
 
-        logging.info(f"Scanning for '{self.event_name}' events from block {from_block} to {to_block}.")
-        try:
-            event_filter = getattr(self.contract.events, self.event_name).create_filter(
-                fromBlock=from_block,
-                toBlock=to_block
-            )
-            events = event_filter.get_all_entries()
-            if events:
-                logging.info(f"Found {len(events)} '{self.event_name}' event(s) in block range.")
-            return [dict(event) for event in events]
-        except BlockNotFound:
-            logging.warning(f"Block range from {from_block} to {to_block} not found. The RPC node may not have this data.")
-        except Exception as e:
-            logging.error(f"An unexpected error occurred during event scanning: {e}")
-        return []
+        logger.info("Scanning for '%s' events from block %s to %s.", self.event_name, from_block, to_block)
+        events = []
+        start = from_block
+        while start <= to_block:
+            end = min(start + self.current_range - 1, to_block)
+            try:
+                raw_logs = await self.contract.w3.eth.get_logs(self.build_filter_params(start, end))
+            except BlockNotFound:
+                logger.warning("Block range from %s to %s not found. The RPC node may not have this data.", start, end)
+                break
+            except Exception as e:
+                if _is_retryable_range_error(e) and self.current_range > MIN_BLOCK_RANGE:
+                    self.current_range = max(MIN_BLOCK_RANGE, self.current_range // 2)
+                    self._consecutive_successes = 0
+                    logger.warning("Node rejected block range starting at %s: %s. Retrying with range %s.", start, e, self.current_range)
+                    continue
+                logger.error("An unexpected error occurred during event scanning: %s", e)
+                raise
+
+            events.extend(self.decode_logs(raw_logs))
+            self._consecutive_successes += 1
+            self._note_event_density(len(raw_logs), end - start + 1)
+            start = end + 1
+
+        if events:
+            logger.info("Found %s '%s' event(s) in block range.", len(events), self.event_name)
+        return events
+
+    def _note_event_density(self, event_count: int, span: int) -> None:
+        """
+        Adapts the scan range to how busy the contract is after a successful span.
+
+        The events-per-block EMA separates quiescent stretches, where wide
+        empty ranges are cheap and the range jumps toward the cap in large
+        steps, from bursts, where the range falls back to the initial value so
+        individual responses stay bounded. In between, the original
+        double-after-a-success-streak policy applies.
+        """
+        self._events_per_block_ema += EVENT_DENSITY_EMA_ALPHA * (event_count / span - self._events_per_block_ema)
+        if event_count:
+            if self.current_range > MAX_BLOCK_RANGE:
+                self.current_range = MAX_BLOCK_RANGE
+                logger.info("Events are flowing again; shrinking scan range back to %s blocks.", self.current_range)
+        elif self._events_per_block_ema < EVENT_DENSITY_IDLE_THRESHOLD:
+            if self.current_range < MAX_BLOCK_RANGE_CAP:
+                self.current_range = min(MAX_BLOCK_RANGE_CAP, self.current_range * 4)
+                self._consecutive_successes = 0
+                logger.info("Contract is quiescent; growing scan range to %s blocks.", self.current_range)
+        elif self._consecutive_successes >= RANGE_GROWTH_SUCCESSES and self.current_range < MAX_BLOCK_RANGE_CAP:
+            self.current_range = min(MAX_BLOCK_RANGE_CAP, self.current_range * 2)
+            self._consecutive_successes = 0
+            logger.info("Node is keeping up; growing scan range to %s blocks.", self.current_range)
+
+class RelayPayload(msgspec.Struct):
+    """
+    The wire format POSTed to the destination API for one relayed event.
+
+    A msgspec Struct serializes straight to JSON bytes without an intermediate
+    dict, which keeps per-event allocation flat during relay bursts.
+    """
+    sourceTransactionHash: str
+    sourceBlockNumber: int
+    bridgeNonce: int
+    sourceSender: str
+    destinationRecipient: str
+    destinationChainId: int
+    tokenAddress: str
+    amount: str
 
 class CrossChainTransactionRelayer:
     """Handles the processing of events and simulates relaying them to a destination chain."""
@@ -215,14 +518,37 @@ class CrossChainTransactionRelayer:
         """
         Initializes the relayer with the destination API endpoint.
 
+        The HTTP session is created lazily on first use so the constructor can
+        run outside an event loop.
+
         Args:
             api_endpoint (str): The URL to which the processed event data will be POSTed.
         """
         self.api_endpoint = api_endpoint
-        self.session = requests.Session()
-        logging.info(f"Transaction Relayer initialized. Destination API: {self.api_endpoint}")
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._semaphore = asyncio.Semaphore(RELAY_CONCURRENCY)
+        # LRU of recently relayed transaction hashes, keyed on the raw bytes
+        # (no .hex() cost) and bounded by SEEN_TX_CACHE_SIZE.
+        self._seen_tx_hashes: 'collections.OrderedDict[bytes, None]' = collections.OrderedDict()
+        logger.info("Transaction Relayer initialized. Destination API: %s", self.api_endpoint)
+
+    async def relay_many(self, events: List[Dict[str, Any]]) -> List[bool]:
+        """
+        Relays a batch of events concurrently, bounded by RELAY_CONCURRENCY.
 
-    def process_and_relay(self, event_log: Dict[str, Any]) -> bool:
+        Args:
+            events (List[Dict[str, Any]]): Decoded event logs from the scanner.
+
+        Returns:
+            List[bool]: Per-event success flags, in input order.
+        """
+        async def relay_bounded(event: Dict[str, Any]) -> bool:
+            async with self._semaphore:
+                return await self.process_and_relay(event)
+
+        return await asyncio.gather(*(relay_bounded(event) for event in events))
+
+    async def process_and_relay(self, event_log: Dict[str, Any]) -> bool:
         """
         Processes a single event log and simulates relaying it.
 
@@ -232,129 +558,347 @@ class CrossChainTransactionRelayer:
         Returns:
             bool: True if the relay simulation was successful, False otherwise.
         """
+        # 0. Skip events that were already relayed (reorg or resumed-run replay).
+        # Marking the hash seen before the POST also collapses duplicates that
+        # arrive within the same concurrent batch; a failed POST unmarks it.
+        tx_hash = event_log['transactionHash']
+        if tx_hash in self._seen_tx_hashes:
+            self._seen_tx_hashes.move_to_end(tx_hash)
+            logger.info("Skipping already-relayed transaction.")
+            return True
+        self._seen_tx_hashes[tx_hash] = None
+        while len(self._seen_tx_hashes) > SEEN_TX_CACHE_SIZE:
+            self._seen_tx_hashes.popitem(last=False)
+
         try:
-            # 1. Format the event data into a payload for the destination chain
-            payload = self._format_payload(event_log)
-            logging.info(f"Prepared payload for transaction {event_log['transactionHash'].hex()}.")
+            # 1. Format the event data into a payload for the destination chain.
+            # The hash is hex-encoded exactly once here; the raw bytes key the
+            # dedupe cache and the string feeds both the payload and the log.
+            tx_hash_hex = tx_hash.hex()
+            payload = self._format_payload(event_log, tx_hash_hex)
+            logger.info("Prepared payload for transaction %s.", tx_hash_hex)
 
             # 2. Simulate sending the transaction to the destination chain
             # In a real system, this would involve signing a transaction and submitting it
             # to the destination chain's RPC node.
-            success, response_data = self._simulate_destination_chain_tx(payload)
+            success, response_data = await self._simulate_destination_chain_tx(payload)
 
             if success:
-                logging.info(f"Successfully relayed transaction. Destination response ID: {response_data.get('id')}")
+                logger.info("Successfully relayed transaction. Destination response ID: %s", response_data.get('id'))
                 return True
             else:
-                logging.error(f"Failed to relay transaction. Reason: {response_data}")
+                logger.error("Failed to relay transaction. Reason: %s", response_data)
+                self._seen_tx_hashes.pop(tx_hash, None)
                 return False
         except Exception as e:
-            logging.error(f"An error occurred during event processing and relaying: {e}")
+            logger.error("An error occurred during event processing and relaying: %s", e)
+            self._seen_tx_hashes.pop(tx_hash, None)
             return False
 
-    def _format_payload(self, event_log: Dict[str, Any]) -> Dict[str, Any]:
+    def _format_payload(self, event_log: Dict[str, Any], tx_hash_hex: str) -> RelayPayload:
         """
         Transforms a raw event log into a structured payload for the destination.
         """
         args = event_log['args']
-        return {
-            'sourceTransactionHash': event_log['transactionHash'].hex(),
-            'sourceBlockNumber': event_log['blockNumber'],
-            'bridgeNonce': args['nonce'],
-            'sourceSender': args['sender'],
-            'destinationRecipient': args['recipient'],
-            'destinationChainId': args['destinationChainId'],
-            'tokenAddress': args['token'],
-            'amount': str(args['amount']) # Convert amount to string to avoid JSON precision issues
-        }
-
-    def _simulate_destination_chain_tx(self, payload: Dict[str, Any]) -> (bool, Dict):
+        return RelayPayload(
+            sourceTransactionHash=tx_hash_hex,
+            sourceBlockNumber=event_log['blockNumber'],
+            bridgeNonce=args['nonce'],
+            sourceSender=args['sender'],
+            destinationRecipient=args['recipient'],
+            destinationChainId=args['destinationChainId'],
+            tokenAddress=args['token'],
+            amount=str(args['amount']) # Convert amount to string to avoid JSON precision issues
+        )
+
+    async def _simulate_destination_chain_tx(self, payload: RelayPayload) -> Tuple[bool, Dict]:
         """
         Simulates the relaying action by sending a POST request to a mock API.
+
+        Connection errors, timeouts, and retryable statuses (429/502/503/504)
+        are retried up to RELAY_MAX_ATTEMPTS times with exponential backoff
+        plus jitter, honoring a Retry-After header when the server sends one.
+        Other 4xx/5xx responses fail immediately.
         """
-        try:
-            response = self.session.post(self.api_endpoint, json=payload, timeout=10)
-            response.raise_for_status()  # Raises an HTTPError for bad responses (4xx or 5xx)
-            return True, response.json()
-        except requests.exceptions.RequestException as e:
-            return False, {'error': str(e)}
+        if self._session is None or self._session.closed:
+            # Pool size matches the relay fan-out so concurrent POSTs reuse
+            # warm connections instead of queueing on a default-sized pool.
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=2 * RELAY_CONCURRENCY, keepalive_timeout=60)
+            )
+        body = msgspec.json.encode(payload)
+        last_error: Dict[str, Any] = {'error': 'no attempts made'}
+        for attempt in range(RELAY_MAX_ATTEMPTS):
+            delay = min(30.0, 0.5 * 2 ** attempt) + random.random() * 0.25
+            try:
+                async with self._session.post(
+                    self.api_endpoint,
+                    data=body,
+                    headers={'Content-Type': 'application/json'},
+                    timeout=aiohttp.ClientTimeout(total=10),
+                ) as response:
+                    if response.status in RETRYABLE_STATUS_CODES:
+                        retry_after = response.headers.get('Retry-After')
+                        if retry_after is not None:
+                            try:
+                                delay = max(delay, float(retry_after))
+                            except ValueError:
+                                pass
+                        last_error = {'error': f'HTTP {response.status}'}
+                    elif response.status >= 400:
+                        return False, {'error': f'HTTP {response.status}'}
+                    else:
+                        return True, orjson.loads(await response.read())
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                last_error = {'error': str(e)}
+            if attempt + 1 < RELAY_MAX_ATTEMPTS:
+                logger.warning("Relay attempt %s failed (%s). Retrying in %.2fs.", attempt + 1, last_error['error'], delay)
+                await asyncio.sleep(delay)
+        return False, last_error
+
+    async def close(self) -> None:
+        """Releases the underlying HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
 
 class BridgeOrchestrator:
     """The main component that orchestrates the entire event listening and relaying process."""
 
     def __init__(self, start_block: Optional[int] = None):
         """
-        Initializes all components of the bridge listener.
+        Stores configuration for the bridge listener.
+
+        Component construction that requires network I/O happens in setup(),
+        which runs inside the event loop.
 
         Args:
-            start_block (Optional[int]): The block number to start scanning from. 
+            start_block (Optional[int]): The block number to start scanning from.
                                          If None, it starts from the latest block.
         """
+        self._start_block = start_block
+        self.state_path = STATE_FILE
+        self.connector: Optional[BlockchainConnector] = None
+        self.scanner: Optional[EventScanner] = None
+        self.relayer: Optional[CrossChainTransactionRelayer] = None
+        self.last_scanned_block: Optional[int] = None
+
+    async def setup(self) -> None:
+        """Initializes all components of the bridge listener."""
         self.connector = BlockchainConnector(SOURCE_CHAIN_RPC_URL)
-        if not self.connector.is_connected():
+        await self.connector.connect()
+        if not await self.connector.is_connected():
             raise RuntimeError("Could not establish initial blockchain connection. Exiting.")
 
-        contract_instance = self.connector.get_contract(BRIDGE_CONTRACT_ADDRESS, BRIDGE_CONTRACT_ABI)
+        contract_instance = await self.connector.get_contract(BRIDGE_CONTRACT_ADDRESS, BRIDGE_CONTRACT_ABI)
         if not contract_instance:
             raise RuntimeError("Could not create contract instance. Exiting.")
 
         self.scanner = EventScanner(contract_instance)
         self.relayer = CrossChainTransactionRelayer(DESTINATION_API_ENDPOINT)
-        
-        # State management for the last processed block
-        self.last_scanned_block = start_block or (self.connector.get_latest_block() - CONFIRMATION_BLOCKS)
+
+        # State management for the last processed block: an explicit start block
+        # wins, then the persisted cursor, then the chain head minus confirmations.
+        resume_block = self._start_block
+        if resume_block is None:
+            resume_block = self._load_state()
+            if resume_block is not None:
+                logger.info("Resuming from persisted state: block %s.", resume_block)
+        self.last_scanned_block = resume_block or (await self.connector.get_latest_block() - CONFIRMATION_BLOCKS)
         if self.last_scanned_block < 0:
              self.last_scanned_block = 0
-        
-        logging.info(f"Orchestrator initialized. Starting scan from block {self.last_scanned_block}.")
 
-    def run(self):
+        logger.info("Orchestrator initialized. Starting scan from block %s.", self.last_scanned_block)
+
+    async def run(self):
         """Starts the main execution loop of the orchestrator."""
-        logging.info("Starting bridge orchestrator main loop... (Press Ctrl+C to stop)")
+        await self.setup()
+        if SOURCE_CHAIN_WS_URL:
+            await self._run_subscription_loop(SOURCE_CHAIN_WS_URL)
+            return
+        logger.info("Starting bridge orchestrator main loop... (Press Ctrl+C to stop)")
+        consecutive_failures = 0
         while True:
             try:
-                self._run_scan_cycle()
-                logging.info(f"Cycle finished. Waiting {SCAN_INTERVAL_SECONDS} seconds for the next one.")
-                time.sleep(SCAN_INTERVAL_SECONDS)
-            except KeyboardInterrupt:
-                logging.info("Shutdown signal received. Exiting gracefully.")
-                break
+                await self._run_scan_cycle()
+                consecutive_failures = 0
+                logger.info("Cycle finished. Waiting %s seconds for the next one.", SCAN_INTERVAL_SECONDS)
+                await asyncio.sleep(SCAN_INTERVAL_SECONDS)
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
-                logging.critical(f"A critical error occurred in the main loop: {e}")
-                time.sleep(60) # Wait longer after a critical failure
+                # Back off harder the longer the failure streak, with jitter so
+                # restarted instances don't hammer a recovering node in lockstep.
+                consecutive_failures += 1
+                delay = min(300.0, 15.0 * 2 ** (consecutive_failures - 1)) + random.random() * 2
+                logger.critical("A critical error occurred in the main loop: %s. Backing off %.1fs (failure #%s).",
+                                e, delay, consecutive_failures)
+                await asyncio.sleep(delay)
+
+    async def _run_subscription_loop(self, ws_url: str) -> None:
+        """
+        Streams matching logs over a persistent eth_subscribe WebSocket.
 
-    def _run_scan_cycle(self):
+        Pushed logs replace the poll + eth_getLogs window entirely; they are
+        buffered until CONFIRMATION_BLOCKS deep (tracked via a newHeads
+        subscription) before being relayed. Reconnects after a pause on failure.
+        """
+        logger.info("Starting push-based subscription loop against %s... (Press Ctrl+C to stop)", ws_url)
+        while True:
+            try:
+                await self._subscribe_and_relay(ws_url)
+                logger.warning("WebSocket stream ended. Reconnecting...")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.critical("WebSocket subscription failed: %s", e)
+                await asyncio.sleep(60) # Wait longer after a critical failure
+
+    async def _subscribe_and_relay(self, ws_url: str) -> None:
+        """Holds one WebSocket connection open and relays confirmed pushed logs."""
+        pending: List[Dict[str, Any]] = []
+        async with aiohttp.ClientSession() as session:
+            async with session.ws_connect(ws_url) as ws:
+                log_filter = {
+                    'address': self.scanner.contract.address,
+                    'topics': [self.scanner.event_topic],
+                }
+                await ws.send_json({'jsonrpc': '2.0', 'id': 1, 'method': 'eth_subscribe', 'params': ['logs', log_filter]})
+                await ws.send_json({'jsonrpc': '2.0', 'id': 2, 'method': 'eth_subscribe', 'params': ['newHeads']})
+                subscriptions: Dict[str, str] = {}
+                async for message in ws:
+                    if message.type != aiohttp.WSMsgType.TEXT:
+                        break
+                    body = orjson.loads(message.data)
+                    if body.get('id') in (1, 2):
+                        subscriptions[body['result']] = 'logs' if body['id'] == 1 else 'newHeads'
+                        continue
+                    if body.get('method') != 'eth_subscription':
+                        continue
+                    params = body['params']
+                    kind = subscriptions.get(params['subscription'])
+                    if kind == 'logs':
+                        raw_log = params['result']
+                        # Logs flagged as removed were reorged out; drop them.
+                        if not raw_log.get('removed'):
+                            pending.extend(self.scanner.decode_logs([raw_log]))
+                    elif kind == 'newHeads':
+                        head = int(params['result']['number'], 16)
+                        pending = await self._flush_confirmed(pending, head)
+
+    async def _flush_confirmed(self, pending: List[Dict[str, Any]], head: int) -> List[Dict[str, Any]]:
+        """Relays buffered events once they are CONFIRMATION_BLOCKS below the head."""
+        confirmed = [e for e in pending if e['blockNumber'] + CONFIRMATION_BLOCKS <= head]
+        if confirmed:
+            await self._relay_events(confirmed)
+            self.last_scanned_block = max(self.last_scanned_block, max(e['blockNumber'] for e in confirmed))
+            self._persist_state()
+        return [e for e in pending if e['blockNumber'] + CONFIRMATION_BLOCKS > head]
+
+    async def close(self) -> None:
+        """Releases the HTTP sessions held by the components."""
+        if self.relayer is not None:
+            await self.relayer.close()
+        if self.connector is not None:
+            await self.connector.close()
+
+    async def _run_scan_cycle(self):
         """Executes a single cycle of fetching blocks, scanning for events, and relaying them."""
-        latest_block = self.connector.get_latest_block()
-        if latest_block is None:
-            logging.error("Could not determine the latest block. Skipping this cycle.")
+        # Pair eth_blockNumber with the first eth_getLogs in one batched request.
+        # Both are then answered by the same backend node, so the reported head
+        # cannot race ahead of (or behind) the log index used for the scan.
+        speculative_end = self.last_scanned_block + self.scanner.current_range
+        filter_params = self.scanner.build_filter_params(self.last_scanned_block + 1, speculative_end)
+        try:
+            latest_hex, raw_logs = await self.connector.batch_call([
+                ('eth_blockNumber', []),
+                ('eth_getLogs', [filter_params]),
+            ])
+        except Exception as e:
+            if _is_retryable_range_error(e):
+                self.scanner.current_range = max(MIN_BLOCK_RANGE, self.scanner.current_range // 2)
+                logger.warning("Batched scan rejected by node: %s. Shrinking range to %s.", e, self.scanner.current_range)
+            else:
+                logger.error("Batched head/logs request failed: %s. Skipping this cycle.", e)
             return
 
+        latest_block = int(latest_hex, 16)
         # The target block is the latest block minus a confirmation delay
         target_block = latest_block - CONFIRMATION_BLOCKS
         if self.last_scanned_block >= target_block:
-            logging.info(f"No new blocks to scan. Current head: {latest_block}, last scanned: {self.last_scanned_block}")
+            logger.info("No new blocks to scan. Current head: %s, last scanned: %s", latest_block, self.last_scanned_block)
             return
 
-        # Process blocks in manageable chunks
-        current_block = self.last_scanned_block + 1
-        while current_block <= target_block:
-            end_block = min(current_block + MAX_BLOCK_RANGE - 1, target_block)
-            
-            events = self.scanner.scan_blocks(current_block, end_block)
-            
-            if events:
-                for event in events:
-                    self.relayer.process_and_relay(event)
-            
-            # Update state for the next iteration
-            self.last_scanned_block = end_block
-            current_block = end_block + 1
+        # The speculative window may reach past the confirmation horizon; only
+        # events at or below target_block are final enough to relay now. Blocks
+        # beyond it stay unscanned and are picked up by the next cycle.
+        events = [e for e in self.scanner.decode_logs(raw_logs) if e['blockNumber'] <= target_block]
+        if events:
+            logger.info("Found %s '%s' event(s) in batched block range.", len(events), self.scanner.event_name)
+            await self._relay_events(events)
+        self.last_scanned_block = min(speculative_end, target_block)
+        self._persist_state()
+
+        # Process any remaining backlog in manageable chunks. Non-overlapping
+        # ranges are independent, so fetch up to MAX_CONCURRENT_FETCHES of them
+        # concurrently. The cursor only advances through the longest contiguous
+        # prefix of successful chunks, so a mid-range failure cannot skip blocks.
+        while self.last_scanned_block < target_block:
+            ranges = []
+            current_block = self.last_scanned_block + 1
+            while current_block <= target_block and len(ranges) < MAX_CONCURRENT_FETCHES:
+                end_block = min(current_block + self.scanner.current_range - 1, target_block)
+                ranges.append((current_block, end_block))
+                current_block = end_block + 1
+
+            results = await asyncio.gather(
+                *(self.scanner.scan_blocks(start, end) for start, end in ranges),
+                return_exceptions=True,
+            )
+            for (start, end), result in zip(ranges, results):
+                if isinstance(result, BaseException):
+                    logger.error("Chunk %s-%s failed: %s. Remaining blocks retry next cycle.", start, end, result)
+                    return
+                if result:
+                    await self._relay_events(result)
+
+                # Update state for the next iteration
+                self.last_scanned_block = end
+                self._persist_state()
+
+    def _load_state(self) -> Optional[int]:
+        """Loads the persisted scan cursor, or None if there is no usable state file."""
+        try:
+            with open(self.state_path) as f:
+                return int(json.load(f)['last_scanned_block'])
+        except FileNotFoundError:
+            return None
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning("Ignoring unreadable state file %s: %s", self.state_path, e)
+            return None
+
+    def _persist_state(self) -> None:
+        """Writes the scan cursor atomically so a crash cannot leave it corrupted."""
+        tmp_path = self.state_path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump({'last_scanned_block': self.last_scanned_block}, f)
+        os.replace(tmp_path, self.state_path)
+
+    async def _relay_events(self, events: List[Dict[str, Any]]) -> None:
+        """Relays a batch of events through the relayer's bounded fan-out."""
+        await self.relayer.relay_many(events)
+
+async def main() -> None:
+    orchestrator = BridgeOrchestrator()
+    try:
+        await orchestrator.run()
+    finally:
+        await orchestrator.close()
 
 if __name__ == "__main__":
     try:
-        orchestrator = BridgeOrchestrator()
-        orchestrator.run()
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        logger.info("Shutdown signal received. Exiting gracefully.")
     except RuntimeError as e:
-        logging.critical(str(e))
+        logger.critical(str(e))
         sys.exit(1)